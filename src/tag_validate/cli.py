@@ -20,7 +20,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from . import __version__
-from .display_utils import format_server_display, format_user_details
+from .display_utils import format_server_display, iter_user_details
 from .gerrit_keys import GerritKeysClient
 from .github_keys import GitHubKeysClient
 from .github_summary import write_validation_summary
@@ -1314,21 +1314,22 @@ def _display_verification_result(
 
     # Build user information display using shared utility
     if platform == "Gerrit" and account:
-        user_lines = format_user_details(
+        user_section = "\n".join(iter_user_details(
             username=account.username,
             email=account.email,
             name=account.name
-        )
+        ))
     elif platform == "GitHub" and github_user_details:
-        user_lines = format_user_details(
+        user_section = "\n".join(iter_user_details(
             username=github_user_details.get("login"),
             email=github_user_details.get("email"),
             name=github_user_details.get("name")
-        )
+        ))
     else:
-        user_lines = []
+        user_section = ""
 
-    user_section = "\n".join(user_lines) if user_lines else f"  • {platform} User: {owner}"
+    if not user_section:
+        user_section = f"  • {platform} User: {owner}"
 
     # Build server display using shared utility
     service = "gerrit" if platform == "Gerrit" else "github"
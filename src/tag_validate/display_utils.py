@@ -8,46 +8,77 @@ This module provides shared display formatting functions to ensure
 consistent output across different commands and workflows.
 """
 
+import functools
+from collections.abc import Iterator
 
+# Default hosts per service that are not worth displaying. Gerrit has no
+# default, so its server is always shown; services without an entry never
+# display their server.
+_HIDDEN_HOSTS: dict[str, frozenset[str]] = {
+    "gerrit": frozenset(),
+    "github": frozenset({"github.com"}),
+}
 
-def format_user_details(
+
+def iter_user_details(
     username: str | None = None,
     email: str | None = None,
     name: str | None = None,
-) -> list[str]:
+) -> Iterator[str]:
     """
-    Format user details as a list of bullet points.
+    Yield user details as bullet points, skipping empty fields.
 
     Args:
         username: User's username
         email: User's email address
         name: User's display name
 
-    Returns:
-        List of formatted strings for user details
+    Yields:
+        Formatted strings for user details
 
     Example:
-        >>> lines = format_user_details(
+        >>> print("\\n".join(iter_user_details(
         ...     username="octocat",
         ...     email="octocat@github.com",
         ...     name="The Octocat"
-        ... )
-        >>> for line in lines:
-        ...     print(line)
-        • Username: octocat
-        • Email: octocat@github.com
-        • Name: The Octocat
+        ... )))
+          • Username: octocat
+          • Email: octocat@github.com
+          • Name: The Octocat
     """
-    lines = []
+    # f-strings are kept on purpose: values may come straight from API
+    # payloads and are not guaranteed to be str, so "+" concatenation
+    # would raise TypeError where formatting coerces safely.
     if username:
-        lines.append(f"  • Username: {username}")
+        yield f"  • Username: {username}"
     if email:
-        lines.append(f"  • Email: {email}")
+        yield f"  • Email: {email}"
     if name:
-        lines.append(f"  • Name: {name}")
-    return lines
+        yield f"  • Name: {name}"
+
+
+def format_user_details(
+    username: str | None = None,
+    email: str | None = None,
+    name: str | None = None,
+) -> list[str]:
+    """
+    Format user details as a list of bullet points.
+
+    Prefer iter_user_details() when the lines are consumed once.
+
+    Args:
+        username: User's username
+        email: User's email address
+        name: User's display name
+
+    Returns:
+        List of formatted strings for user details
+    """
+    return list(iter_user_details(username=username, email=email, name=name))
 
 
+@functools.lru_cache(maxsize=128)
 def should_display_server(
     service: str,
     server: str | None = None,
@@ -58,6 +89,9 @@ def should_display_server(
     For Gerrit: Always show server (required)
     For GitHub: Only show if not github.com (i.e., GitHub Enterprise)
 
+    Results are memoized, as the same service/server pair repeats for
+    every key verification in a run.
+
     Args:
         service: Service name ("github" or "gerrit")
         server: Server hostname
@@ -76,14 +110,11 @@ def should_display_server(
     if not server:
         return False
 
-    if service == "gerrit":
-        return True
-    elif service == "github":
-        return server != "github.com"
-
-    return False
+    hidden = _HIDDEN_HOSTS.get(service)
+    return hidden is not None and server not in hidden
 
 
+@functools.lru_cache(maxsize=128)
 def format_server_display(
     service: str,
     server: str | None = None,
@@ -91,6 +122,8 @@ def format_server_display(
     """
     Format server display string if server should be shown.
 
+    Results are memoized alongside should_display_server().
+
     Args:
         service: Service name ("github" or "gerrit")
         server: Server hostname
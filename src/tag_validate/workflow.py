@@ -36,7 +36,7 @@ import re
 import subprocess
 from pathlib import Path
 
-from .display_utils import format_server_display, format_user_details
+from .display_utils import format_server_display, iter_user_details
 from .gerrit_keys import (
     GerritInvalidCredentialsError,
     GerritKeysClient,
@@ -1333,12 +1333,11 @@ class ValidationWorkflow:
                 lines.append(f"{service_name} User:")
 
                 # Build user details using shared utility
-                user_lines = format_user_details(
+                lines.extend(iter_user_details(
                     username=k.username,
                     email=k.user_email,
                     name=k.user_name
-                )
-                lines.extend(user_lines)
+                ))
                 lines.append("")
 
         # Errors - filter out redundant registration errors
@@ -33,13 +33,32 @@ SAMPLE_USERNAME = "jdoe"
 SAMPLE_EMAIL = "jdoe@example.com"
 SAMPLE_SERVER = "gerrit.onap.org"
 
+# Matches ANSI escape sequences emitted by Rich/Typer output
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared across tests (CliRunner is stateless)."""
     return CliRunner()
 
 
+@pytest.fixture
+def gerrit_mocks():
+    """
+    Patch GerritKeysClient with an async context manager mock.
+
+    Yields:
+        Tuple of (mock_client_class, mock_client), where mock_client is the
+        object returned from ``async with GerritKeysClient(...)``.
+    """
+    with patch("tag_validate.cli.GerritKeysClient") as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        yield mock_client_class, mock_client
+
+
 @pytest.fixture
 def mock_gerrit_account():
     """Create a mock Gerrit account."""
@@ -90,8 +109,11 @@ def strip_ansi_codes(text: str) -> str:
     Returns:
         Text without ANSI codes
     """
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    # CliRunner output is usually uncolored; skip the regex when there is
+    # no escape character to strip
+    if "\x1b" not in text:
+        return text
+    return _ANSI_RE.sub("", text)
 
 
 class TestVerifyGerritBasic:
@@ -141,14 +163,11 @@ class TestVerifyGerritBasic:
 class TestVerifyGerritGPG:
     """Test GPG key verification via Gerrit CLI."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_gpg_key_registered(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test successful GPG key verification."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -170,14 +189,11 @@ class TestVerifyGerritGPG:
         assert "REGISTERED" in output
         assert SAMPLE_USERNAME in output
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_gpg_key_not_registered(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_failure
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_failure
     ):
         """Test GPG key not registered."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_failure
@@ -198,14 +214,11 @@ class TestVerifyGerritGPG:
         output = strip_ansi_codes(result.stdout)
         assert "NOT REGISTERED" in output
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_gpg_key_explicit_type(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test GPG key verification with explicit type."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -231,14 +244,11 @@ class TestVerifyGerritGPG:
 class TestVerifyGerritSSH:
     """Test SSH key verification via Gerrit CLI."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_ssh_key_registered(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test successful SSH key verification."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_username.return_value = mock_gerrit_account
         mock_client.verify_ssh_key_registered.return_value = mock_verification_success
@@ -261,14 +271,11 @@ class TestVerifyGerritSSH:
         assert output["success"] is True
         assert output["is_registered"] is True
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_ssh_key_explicit_type(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test SSH key verification with explicit type."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_username.return_value = mock_gerrit_account
         mock_client.verify_ssh_key_registered.return_value = mock_verification_success
@@ -293,14 +300,11 @@ class TestVerifyGerritSSH:
         assert output["success"] is True
         mock_client.verify_ssh_key_registered.assert_called_once()
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_verify_ssh_key_without_prefix(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test SSH fingerprint without SHA256 prefix."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_username.return_value = mock_gerrit_account
         mock_client.verify_ssh_key_registered.return_value = mock_verification_success
@@ -328,14 +332,11 @@ class TestVerifyGerritSSH:
 class TestVerifyGerritAutoDetection:
     """Test automatic key type detection for Gerrit."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_auto_detect_gpg_hex(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test auto-detection of GPG key from hex format."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -355,14 +356,11 @@ class TestVerifyGerritAutoDetection:
         assert result.exit_code == 0
         mock_client.verify_gpg_key_registered.assert_called_once()
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_auto_detect_ssh_prefix(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test auto-detection of SSH key from SHA256: prefix."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_username.return_value = mock_gerrit_account
         mock_client.verify_ssh_key_registered.return_value = mock_verification_success
@@ -389,14 +387,11 @@ class TestVerifyGerritAutoDetection:
 class TestVerifyGerritJSON:
     """Test JSON output mode for Gerrit verification."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_gerrit_json_success(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test JSON output for successful verification."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -422,14 +417,11 @@ class TestVerifyGerritJSON:
         assert output["server"] == SAMPLE_SERVER
         assert output["service"] == "gerrit"
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_gerrit_json_failure(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_failure
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_failure
     ):
         """Test JSON output for failed verification."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_failure
@@ -452,12 +444,9 @@ class TestVerifyGerritJSON:
         assert output["success"] is False
         assert output["is_registered"] is False
 
-    @patch("tag_validate.cli.GerritKeysClient")
-    def test_gerrit_json_account_not_found(self, mock_client_class, runner):
+    def test_gerrit_json_account_not_found(self, gerrit_mocks, runner):
         """Test JSON output when account is not found."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = None
 
@@ -490,14 +479,11 @@ class TestVerifyGerritJSON:
 class TestVerifyGerritServerDiscovery:
     """Test Gerrit server auto-discovery from GitHub org."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_github_org_discovery(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test server discovery from GitHub organization."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -524,14 +510,11 @@ class TestVerifyGerritServerDiscovery:
 class TestVerifyGerritAuthentication:
     """Test Gerrit authentication options."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_gerrit_with_credentials(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test Gerrit verification with username and password."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
@@ -632,12 +615,9 @@ class TestVerifyGerritTestMode:
 class TestVerifyGerritErrorHandling:
     """Test error handling for Gerrit verification."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
-    def test_gerrit_server_error(self, mock_client_class, runner):
+    def test_gerrit_server_error(self, gerrit_mocks, runner):
         """Test handling of Gerrit server errors."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.side_effect = GerritKeysError(
             "Server connection failed"
@@ -658,12 +638,9 @@ class TestVerifyGerritErrorHandling:
         assert result.exit_code != 0
         assert "Error" in result.stdout
 
-    @patch("tag_validate.cli.GerritKeysClient")
-    def test_gerrit_server_error_json(self, mock_client_class, runner):
+    def test_gerrit_server_error_json(self, gerrit_mocks, runner):
         """Test JSON output for Gerrit server errors."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.side_effect = GerritKeysError(
             "Server connection failed"
@@ -716,14 +693,11 @@ class TestVerifyGerritErrorHandling:
 class TestVerifyGerritEdgeCases:
     """Test edge cases for Gerrit verification."""
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_email_vs_username_detection(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test automatic detection of email vs username."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         # First test with email
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
@@ -766,14 +740,11 @@ class TestVerifyGerritEdgeCases:
         assert result.exit_code == 0
         mock_client.lookup_account_by_username.assert_called_once_with(SAMPLE_USERNAME)
 
-    @patch("tag_validate.cli.GerritKeysClient")
     def test_short_flags(
-        self, mock_client_class, runner, mock_gerrit_account, mock_verification_success
+        self, gerrit_mocks, runner, mock_gerrit_account, mock_verification_success
     ):
         """Test short flag variants."""
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        mock_client_class.return_value.__aexit__.return_value = AsyncMock()
+        mock_client_class, mock_client = gerrit_mocks
 
         mock_client.lookup_account_by_email.return_value = mock_gerrit_account
         mock_client.verify_gpg_key_registered.return_value = mock_verification_success
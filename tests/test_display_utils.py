@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2025 Linux Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for shared display helpers in tag_validate.display_utils.
+
+This module tests:
+- User detail formatting (list and generator forms)
+- Server display rules for GitHub and Gerrit
+- Memoization of server display helpers
+"""
+
+from tag_validate.display_utils import (
+    format_server_display,
+    format_user_details,
+    iter_user_details,
+    should_display_server,
+)
+
+
+class TestFormatUserDetails:
+    """Test format_user_details function."""
+
+    def test_all_fields(self):
+        """Test formatting with all fields present."""
+        assert format_user_details(
+            username="octocat",
+            email="octocat@github.com",
+            name="The Octocat",
+        ) == [
+            "  • Username: octocat",
+            "  • Email: octocat@github.com",
+            "  • Name: The Octocat",
+        ]
+
+    def test_missing_fields_skipped(self):
+        """Test that empty or missing fields are omitted."""
+        assert format_user_details(username="octocat", email="") == [
+            "  • Username: octocat",
+        ]
+        assert format_user_details() == []
+
+    def test_iter_matches_list(self):
+        """Test that iter_user_details yields the same lines lazily."""
+        details = iter_user_details(username="octocat", name="The Octocat")
+        assert not isinstance(details, list)
+        assert list(details) == format_user_details(
+            username="octocat", name="The Octocat"
+        )
+
+
+class TestServerDisplay:
+    """Test should_display_server and format_server_display functions."""
+
+    def test_gerrit_always_shown(self):
+        """Test that Gerrit servers are always displayed."""
+        assert should_display_server("gerrit", "gerrit.onap.org") is True
+        assert (
+            format_server_display("gerrit", "gerrit.onap.org")
+            == "Gerrit Server: gerrit.onap.org"
+        )
+
+    def test_github_default_hidden(self):
+        """Test that github.com is not displayed."""
+        assert should_display_server("github", "github.com") is False
+        assert format_server_display("github", "github.com") is None
+
+    def test_github_enterprise_shown(self):
+        """Test that GitHub Enterprise servers are displayed."""
+        assert should_display_server("github", "github.example.com") is True
+        assert (
+            format_server_display("github", "github.example.com")
+            == "GitHub Server: github.example.com"
+        )
+
+    def test_no_server(self):
+        """Test that a missing server is never displayed."""
+        assert should_display_server("gerrit", None) is False
+        assert should_display_server("github", "") is False
+        assert format_server_display("gerrit") is None
+
+    def test_unknown_service(self):
+        """Test that unknown services are not displayed."""
+        assert should_display_server("gitlab", "gitlab.com") is False
+        assert format_server_display("gitlab", "gitlab.com") is None
+
+    def test_results_are_cached(self):
+        """Test that repeated lookups are served from the cache."""
+        format_server_display.cache_clear()
+        format_server_display("gerrit", "gerrit.example.org")
+        format_server_display("gerrit", "gerrit.example.org")
+        info = format_server_display.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1